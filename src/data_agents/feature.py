@@ -23,6 +23,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from .geometry import Geometry
@@ -37,8 +38,17 @@ class Feature:
             self._geometry: Geometry = geo_json._geometry
             self._properties: dict[str, Any] = geo_json._properties
         else:
-            self._type = geo_json["type"] if "type" in geo_json else "Feature"
-            self._geometry = Geometry(geo_json["geometry"])
+            feature_type = geo_json.get("type", "Feature")
+            self._type = (
+                sys.intern(feature_type)
+                if isinstance(feature_type, str)
+                else feature_type
+            )
+            geometry = geo_json["geometry"]
+            # Geometries are never mutated, so an existing instance can be shared
+            self._geometry = (
+                geometry if isinstance(geometry, Geometry) else Geometry(geometry)
+            )
             self._properties = geo_json["properties"]
 
     def to_dict(self) -> dict[str, Any]:
@@ -50,4 +60,10 @@ class Feature:
         }
 
     def __getitem__(self, key: str) -> Any:
-        return self.to_dict()[key]
+        if key == "type":
+            return self._type
+        if key == "geometry":
+            return self._geometry.to_dict()
+        if key == "properties":
+            return self._properties
+        raise KeyError(key)
@@ -23,14 +23,21 @@
 
 from __future__ import annotations
 
+import json
+import os
 import re
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any, TextIO
 
 from .feature import Feature
 from .geometry import Geometry
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from .filter import Filter
     from .join import Join
 
@@ -73,14 +80,15 @@ class FeatureCollection:
         }
 
     def __getitem__(self, key: str) -> Any:
+        if key == "type":
+            return self._type
         return self.to_dict()[key]
 
     def _compute_filters(self) -> FeatureCollection:
         """Apply all filters to the FeatureCollection."""
-        features = self._features
-        for filter in self._filters:
-            features = filter.compute(features)
-        new_fc = FeatureCollection(features)
+        from .filter import Filter  # Import here to avoid circular dependency
+
+        new_fc = FeatureCollection(Filter.compute_all(self._filters, self._features))
         return new_fc
 
     def compute(self) -> FeatureCollection:
@@ -95,6 +103,37 @@ class FeatureCollection:
         """Return the list of features in the FeatureCollection."""
         return self._features
 
+    def coordinates(self) -> NDArray[np.float64]:
+        """Return the coordinates of all Point features as an (N, 2) array.
+
+        The array lets distance calculations over the collection be vectorized.
+        It is built on each call, so it always reflects the current features.
+        Only the first two values of each position are kept, so a third
+        (altitude) value is ignored.
+
+        Returns:
+            A float64 array with one row of Point coordinates per feature, in the
+            same order as features().
+        """
+        import numpy as np
+
+        coords: list[list[float]] = []
+        for feature in self._features:
+            geometry = feature["geometry"]
+            if geometry["type"] != "Point":
+                raise ValueError(
+                    f"Expected Point geometries, found '{geometry['type']}'"
+                )
+            position = geometry["coordinates"]
+            if len(position) < 2:
+                raise ValueError(
+                    f"Expected at least 2 Point coordinates, found {position}"
+                )
+            coords.append(position[:2])
+        if not coords:
+            return np.empty((0, 2), dtype=np.float64)
+        return np.array(coords, dtype=np.float64)
+
     def filter(self, filter: Filter | list[Filter]) -> FeatureCollection:
         """Apply a filter to the FeatureCollection.
 
@@ -112,6 +151,20 @@ class FeatureCollection:
         """Return all information about the FeatureCollection."""
         return self.compute().to_dict()
 
+    def to_ndjson(self, ndjson_file: str | os.PathLike[str]) -> None:
+        """Write the computed features as newline-delimited GeoJSON.
+
+        Each Feature is serialized on its own line, so the full collection is
+        never held in memory as a single string.
+
+        Args:
+            ndjson_file: Path to the output file.
+        """
+        with open(ndjson_file, "w") as f:
+            for feature in self.compute().features():
+                f.write(json.dumps(feature.to_dict()))
+                f.write("\n")
+
     def properties(self, regex: str | None = None) -> dict[str, Any]:
         """Return a dictionary of all property names in the FeatureCollection.
         Args:
@@ -122,12 +175,14 @@ class FeatureCollection:
             values.
         """
 
-        prop_set: set[Any] = set()
+        keys: dict[str, None] = {}
         for feature in self._features:
-            for key in feature["properties"].keys():
-                if regex is None or re.search(regex, key):
-                    prop_set.add(key)
-        return dict.fromkeys(prop_set)
+            keys.update(dict.fromkeys(feature["properties"]))
+        if regex is None:
+            return keys
+        # Match each distinct key once rather than once per feature
+        pattern = re.compile(regex)
+        return {key: None for key in keys if pattern.search(key)}
 
     @staticmethod
     def from_dict(
@@ -157,32 +212,101 @@ class FeatureCollection:
 
     @staticmethod
     def from_csv(
-        csv_file: str,
+        csv_file: str | os.PathLike[str] | TextIO,
         geometry_fn: Callable[[dict[str, Any]], Geometry],
     ) -> FeatureCollection:
         """Create a FeatureCollection from a CSV file and a geometry function.
 
         Args:
-            csv_file: Path to the CSV file.
+            csv_file: Path to the CSV file, or an open text stream.
+            geometry_fn: A function that takes a property dictionary and returns a
+                         geometry dictionary.
+        """
+        return FeatureCollection(
+            list(FeatureCollection.from_csv_stream(csv_file, geometry_fn))
+        )
+
+    @staticmethod
+    def from_csv_stream(
+        csv_file: str | os.PathLike[str] | TextIO,
+        geometry_fn: Callable[[dict[str, Any]], Geometry],
+    ) -> Iterator[Feature]:
+        """Lazily read Features from a CSV file, one row at a time.
+
+        Args:
+            csv_file: Path to the CSV file, or an open text stream. Streams are
+                      read from their current position and are not closed.
             geometry_fn: A function that takes a property dictionary and returns a
                          geometry dictionary.
+
+        Yields:
+            A Feature for each data row in the CSV file.
         """
         import csv
 
-        features: list[Feature] = []
-        with open(csv_file) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                geometry: Geometry = geometry_fn(row)
-                feature: Feature = Feature(
+        stream: AbstractContextManager[TextIO] = (
+            open(csv_file, newline="")
+            if isinstance(csv_file, (str, os.PathLike))
+            else nullcontext(csv_file)
+        )
+        with stream as f:
+            for row in csv.DictReader(f):
+                yield Feature(
                     {
                         "type": "Feature",
-                        "geometry": geometry,
+                        "geometry": geometry_fn(row),
                         "properties": row,
                     }
                 )
-                features.append(feature)
-        return FeatureCollection(features)
+
+    @staticmethod
+    def from_ndjson(ndjson_file: str | os.PathLike[str]) -> FeatureCollection:
+        """Create a FeatureCollection from a newline-delimited GeoJSON file.
+
+        Args:
+            ndjson_file: Path to a file with one GeoJSON Feature per line.
+        """
+        return FeatureCollection(
+            list(FeatureCollection.from_ndjson_stream(ndjson_file))
+        )
+
+    @staticmethod
+    def from_ndjson_stream(ndjson_file: str | os.PathLike[str]) -> Iterator[Feature]:
+        """Lazily read Features from a newline-delimited GeoJSON file.
+
+        Blank lines and the record separators used by GeoJSON text sequences
+        (RFC 8142) are skipped.
+
+        Args:
+            ndjson_file: Path to a file with one GeoJSON Feature per line.
+
+        Yields:
+            A Feature for each line in the file.
+
+        Raises:
+            ValueError: If a line is not a GeoJSON Feature object.
+        """
+        with open(ndjson_file, "rb") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip(b"\x1e \t\r\n")
+                if line:
+                    geo_json = json.loads(line)
+                    if (
+                        not isinstance(geo_json, dict)
+                        or "geometry" not in geo_json
+                        or "properties" not in geo_json
+                    ):
+                        raise ValueError(
+                            f"Line {line_number} of {ndjson_file} is not a GeoJSON "
+                            "Feature with 'geometry' and 'properties' members"
+                        )
+                    # Each line is parsed on its own, so share repeated key strings
+                    properties = geo_json["properties"]
+                    if isinstance(properties, dict):
+                        geo_json["properties"] = {
+                            sys.intern(key): value for key, value in properties.items()
+                        }
+                    yield Feature(geo_json)
 
     @staticmethod
     def from_service(path: str, **kwargs: Any) -> FeatureCollection:
@@ -23,12 +23,143 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .feature import Feature
 from .feature_collection import FeatureCollection
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# Mean Earth radius in meters, used for great-circle distances
+_EARTH_RADIUS_M: float = 6_371_000.0
+
+
+def _haversine(
+    lat: float,
+    lon: float,
+    lats: NDArray[np.float64],
+    lons: NDArray[np.float64],
+    cos_lats: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Great-circle distances in meters from one point to an array of points.
+
+    Args:
+        lat: Latitude of the reference point in radians.
+        lon: Longitude of the reference point in radians.
+        lats: Latitudes of the other points in radians.
+        lons: Longitudes of the other points in radians.
+        cos_lats: Precomputed cosines of ``lats``.
+
+    Returns:
+        An array of distances in meters, one per point.
+    """
+    import numpy as np
+
+    a = np.sin((lats - lat) / 2)
+    a *= a
+    sin_dlon = np.sin((lons - lon) / 2)
+    sin_dlon *= sin_dlon
+    sin_dlon *= cos_lats
+    a += np.cos(lat) * sin_dlon
+    np.clip(a, 0.0, 1.0, out=a)
+    distances: NDArray[np.float64] = np.arcsin(np.sqrt(a, out=a), out=a)
+    distances *= 2 * _EARTH_RADIUS_M
+    return distances
+
+
+def _haversine_point(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two points given in radians."""
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * _EARTH_RADIUS_M * math.asin(math.sqrt(min(a, 1.0)))
+
+
+class _LatitudeIndex:
+    """Point coordinates sorted by latitude, with their trigonometry precomputed."""
+
+    def __init__(self, coords: NDArray[np.float64]):
+        """Build the index.
+
+        Args:
+            coords: An (N, 2) array of [latitude, longitude] pairs in degrees.
+        """
+        import numpy as np
+
+        self._order: NDArray[np.intp] = np.argsort(coords[:, 0], kind="stable")
+        self._latitudes: NDArray[np.float64] = coords[self._order, 0]
+        self._lat_rad: NDArray[np.float64] = np.radians(self._latitudes)
+        self._lon_rad: NDArray[np.float64] = np.radians(coords[self._order, 1])
+        self._cos_lat: NDArray[np.float64] = np.cos(self._lat_rad)
+
+        # Circle around the bounding box center that encloses every point
+        lats, lons = coords[:, 0], coords[:, 1]
+        self._center_lat: float = math.radians(float(lats.min() + lats.max()) / 2)
+        self._center_lon: float = math.radians(float(lons.min() + lons.max()) / 2)
+        self._radius: float = float(
+            _haversine(
+                self._center_lat,
+                self._center_lon,
+                self._lat_rad,
+                self._lon_rad,
+                self._cos_lat,
+            ).max()
+        )
+
+    def within(self, lat: float, lon: float, distance: float) -> NDArray[np.intp]:
+        """Return the indices of points within a distance of a location.
+
+        Args:
+            lat: Latitude of the location in degrees.
+            lon: Longitude of the location in degrees.
+            distance: The distance threshold in meters.
+
+        Returns:
+            Sorted indices into the original coordinate array.
+        """
+        import numpy as np
+
+        lat_rad, lon_rad = math.radians(lat), math.radians(lon)
+        to_center = _haversine_point(
+            lat_rad, lon_rad, self._center_lat, self._center_lon
+        )
+        # By the triangle inequality, either every point is in range or none is
+        if to_center + self._radius <= distance:
+            return np.arange(self._order.size)
+        if to_center - self._radius > distance:
+            return np.empty(0, dtype=np.intp)
+
+        # Points further apart in latitude than the distance cannot match
+        band = np.degrees(distance / _EARTH_RADIUS_M)
+        start = np.searchsorted(self._latitudes, lat - band, side="left")
+        stop = np.searchsorted(self._latitudes, lat + band, side="right")
+        distances = _haversine(
+            lat_rad,
+            lon_rad,
+            self._lat_rad[start:stop],
+            self._lon_rad[start:stop],
+            self._cos_lat[start:stop],
+        )
+        return np.sort(self._order[start:stop][distances <= distance])
+
+
+class _JoinFeatures(list[Feature]):
+    """A snapshot of the features a join filter is applied against.
+
+    Filter.compute() passes the same snapshot to every join function call, so
+    join functions can keep data derived from it in ``cache`` for the duration
+    of that computation.
+    """
+
+    def __init__(self, features: list[Feature]):
+        super().__init__(features)
+        self.cache: dict[str, Any] = {}
+
 
 class Filter:
     """A class to filter data based on specified criteria."""
@@ -57,8 +188,12 @@ class Filter:
             setattr(self, f"_{key.lstrip('_')}", value)
 
     def to_dict(self) -> dict[str, Any]:
-        """Return the filter as a dictionary."""
-        return self.__dict__
+        """Return the filter as a dictionary.
+
+        The dictionary is a shallow copy, so callers can modify it without
+        changing the filter.
+        """
+        return dict(self.__dict__)
 
     def apply_feature_collection(self, feature_collection: FeatureCollection) -> Filter:
         """Apply a FeatureCollection to the filter for joined filters.
@@ -100,9 +235,9 @@ class Filter:
         # Implement filtering logic based on the filter type and criteria
         filtered_features: list[Feature] = []
         if self._feature_collection is not None:
-            right_features = self._feature_collection.features()
             if self._join_fn is None:
                 raise ValueError(f"Invalid filter for join: {self._type}")
+            right_features = _JoinFeatures(self._feature_collection.features())
             for feature in features:
                 filtered_features.extend(
                     self._join_fn(
@@ -118,6 +253,46 @@ class Filter:
                     filtered_features.append(feature)
         return filtered_features
 
+    @staticmethod
+    def compute_all(filters: list[Filter], features: list[Feature]) -> list[Feature]:
+        """Apply a sequence of filters to a list of features.
+
+        Consecutive filters that are not joins are fused, so each feature is
+        visited once per run of predicates instead of once per filter.
+
+        Args:
+            filters (list[Filter]): The filters to apply, in order.
+            features (list[Feature]): The list of features to filter.
+
+        Returns:
+            list[Feature]: The filtered list of features.
+        """
+        predicates: list[Callable[[Feature], bool]] = []
+
+        def apply_predicates(features: list[Feature]) -> list[Feature]:
+            if len(predicates) == 1:
+                return [feature for feature in features if predicates[0](feature)]
+            filtered_features: list[Feature] = []
+            for feature in features:
+                for predicate in predicates:
+                    if not predicate(feature):
+                        break
+                else:
+                    filtered_features.append(feature)
+            return filtered_features
+
+        for filter in filters:
+            if filter._feature_collection is None:
+                predicates.append(filter._fn)
+                continue
+            if predicates:
+                features = apply_predicates(features)
+                predicates.clear()
+            features = filter.compute(features)
+        if predicates:
+            features = apply_predicates(features)
+        return features
+
     @staticmethod
     def eq(field: str, value: Any) -> Filter:
         """Create an equality filter.
@@ -160,10 +335,13 @@ class Filter:
     def within_distance(left_field: str, right_field: str, distance: float) -> Filter:
         """Create a filter that checks if two fields are within a certain distance.
 
+        Distances are great-circle distances between Point geometries whose
+        coordinates are [latitude, longitude] in degrees.
+
         Args:
             left_field (str): The name of the left field.
             right_field (str): The name of the right field.
-            distance (float): The distance threshold.
+            distance (float): The distance threshold in meters.
 
         Returns:
             Filter: An instance of the Filter class.
@@ -178,7 +356,17 @@ class Filter:
             match_key: str,
             quality_key: str,
         ) -> list[Feature]:
-            return right_features  # Stub implementation
+            if len(right_features) == 0:
+                return []
+            # Filter.compute() shares one snapshot across all left features, so
+            # the index is built once per computation and dropped with it
+            cache: dict[str, Any] = getattr(right_features, "cache", {})
+            if "latitude_index" not in cache:
+                coords = FeatureCollection(right_features).coordinates()
+                cache["latitude_index"] = _LatitudeIndex(coords)
+            lat, lon = left["geometry"]["coordinates"][:2]
+            matches = cache["latitude_index"].within(lat, lon, distance)
+            return [right_features[i] for i in matches]
 
         return Filter(
             fn=fn,
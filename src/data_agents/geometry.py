@@ -23,6 +23,7 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from typing import Any
 
@@ -35,7 +36,12 @@ class Geometry:
             self._type: str = geo_json._type
             self._coordinates: list[float] = geo_json._coordinates
         else:
-            self._type = geo_json["type"]
+            geometry_type = geo_json["type"]
+            self._type = (
+                sys.intern(geometry_type)
+                if isinstance(geometry_type, str)
+                else geometry_type
+            )
             self._coordinates = geo_json["coordinates"]
 
     def to_dict(self) -> dict[str, Any]:
@@ -46,7 +52,11 @@ class Geometry:
         }
 
     def __getitem__(self, key: str) -> Any:
-        return self.to_dict()[key]
+        if key == "type":
+            return self._type
+        if key == "coordinates":
+            return self._coordinates
+        raise KeyError(key)
 
     @staticmethod
     def to_point(coords: list[str]) -> Callable[[dict[str, Any]], Geometry]:
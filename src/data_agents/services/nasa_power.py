@@ -24,12 +24,13 @@
 from __future__ import annotations
 
 import re
-from typing import Any
-
-import requests
+from typing import TYPE_CHECKING, Any
 
 from ..feature_collection import FeatureCollection
 
+if TYPE_CHECKING:
+    import requests
+
 
 class NasaPower(FeatureCollection):
     """Adapter for NASA POWER data as a FeatureCollection."""
@@ -90,6 +91,8 @@ class NasaPower(FeatureCollection):
     }
 
     def __init__(self, path: list[str], **kwargs: Any | None):
+        import requests  # Import here to keep package import lightweight
+
         # Here we would normally implement logic to fetch data from NASA POWER API
         # For this example, we'll simulate with a placeholder GeoJSON structure
         geo_json: dict[str, Any] = {"type": "FeatureCollection", "features": []}
@@ -126,6 +129,8 @@ class NasaPower(FeatureCollection):
     def properties(self, regex: str | None = None) -> dict[str, Any]:
         """Return a dict of available properties for the NASA POWER
         FeatureCollection."""
+        import requests
+
         url = f"{self.BASE_URL}system/manager/parameters"
         params = {"community": self._community, "temporal": self._product.lower()}
 
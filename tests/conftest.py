@@ -0,0 +1,39 @@
+# Copyright (c) 2025 The KBase Project and its Contributors
+# Copyright (c) 2025 Cohere Consulting, LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+"""Shared fixtures for the data_agents test suite."""
+
+import csv
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_csv_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a small CSV of point features once per test session."""
+    csv_file = tmp_path_factory.mktemp("data") / "features.csv"
+    with open(csv_file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["id", "name", "lat", "lon"])
+        writer.writeheader()
+        writer.writerow({"id": 1, "name": "Feature 1", "lat": 0.5, "lon": 102.0})
+        writer.writerow({"id": 2, "name": "Feature 2", "lat": 1.5, "lon": 103.0})
+    return csv_file
@@ -23,7 +23,9 @@
 
 from typing import Any
 
-from data_agents import Feature
+import pytest
+
+from data_agents import Feature, Geometry
 
 
 def test_feature_to_dict():
@@ -52,3 +54,14 @@ def test_feature_getitem():
     assert feature["type"] == "Feature"
     assert feature["geometry"] == {"type": "Point", "coordinates": [102.0, 0.5]}
     assert feature["properties"] == {"prop0": "value0"}
+    with pytest.raises(KeyError):
+        feature["missing"]
+
+
+def test_feature_shares_geometry():
+    """Test that Feature reuses Geometry instances instead of copying them."""
+    geometry = Geometry({"type": "Point", "coordinates": [102.0, 0.5]})
+    feature = Feature({"geometry": geometry, "properties": {"prop0": "value0"}})
+    assert feature._geometry is geometry
+    assert Feature(feature)._geometry is geometry
+    assert feature["geometry"] == {"type": "Point", "coordinates": [102.0, 0.5]}
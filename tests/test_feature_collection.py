@@ -21,10 +21,12 @@
 
 """Test for the feature_collection module of data_agents package."""
 
-import tempfile
+import io
 from typing import Any
 
-from data_agents import Feature, FeatureCollection, Geometry
+import pytest
+
+from data_agents import Feature, FeatureCollection, Filter, Geometry
 
 
 def test_feature_collection_to_dict():
@@ -152,6 +154,22 @@ def test_feature_collection_properties():
     expected_digit_properties = {"prop0": None, "prop1": None}
     assert digit_properties == expected_digit_properties
 
+    # properties added after an earlier call are picked up
+    feature_collection.features().append(
+        Feature(
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [104.0, 2.5]},
+                "properties": {"prop2": "value2"},
+            }
+        )
+    )
+    assert feature_collection.properties("prop\\d") == {
+        "prop0": None,
+        "prop1": None,
+        "prop2": None,
+    }
+
 
 def test_feature_collection_from_dict():
     """Test the from_dict static method of FeatureCollection class."""
@@ -195,14 +213,6 @@ def test_feature_collection_from_dict():
 
 def test_feature_collection_from_csv():
     """Test the from_csv static method of FeatureCollection class."""
-    import csv
-
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".csv") as tmpfile:
-        csv_file = tmpfile.name
-        writer = csv.DictWriter(tmpfile, fieldnames=["id", "name", "lat", "lon"])
-        writer.writeheader()
-        writer.writerow({"id": 1, "name": "Feature 1", "lat": 0.5, "lon": 102.0})
-        writer.writerow({"id": 2, "name": "Feature 2", "lat": 1.5, "lon": 103.0})
 
     def geometry_fn(item: dict[str, Any]) -> Geometry:
         return Geometry(
@@ -212,7 +222,10 @@ def test_feature_collection_from_csv():
             }
         )
 
-    feature_collection = FeatureCollection.from_csv(str(csv_file), geometry_fn)
+    csv_text = io.StringIO(
+        "id,name,lat,lon\n1,Feature 1,0.5,102.0\n2,Feature 2,1.5,103.0\n"
+    )
+    feature_collection = FeatureCollection.from_csv(csv_text, geometry_fn)
     expected_dict: dict[str, Any] = {
         "type": "FeatureCollection",
         "features": [
@@ -245,3 +258,189 @@ def test_feature_collection_from_csv():
         ],
     }
     assert feature_collection.to_dict() == expected_dict
+
+
+def test_feature_collection_from_csv_stream(sample_csv_path):
+    """Test the from_csv_stream static method of FeatureCollection class."""
+    stream = FeatureCollection.from_csv_stream(
+        sample_csv_path, Geometry.to_point(["lat", "lon"])
+    )
+    assert not isinstance(stream, list)
+    features = list(stream)
+    assert len(features) == 2
+    assert features[0].to_dict() == {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [0.5, 102.0]},
+        "properties": {"id": "1", "name": "Feature 1", "lat": "0.5", "lon": "102.0"},
+    }
+    assert features[1]["properties"]["id"] == "2"
+
+
+def test_feature_collection_from_csv_text_stream():
+    """Test reading a FeatureCollection from an in-memory CSV stream."""
+    csv_text = io.StringIO("id,lat,lon\n1,0.5,102.0\n\n2,1.5,103.0\n")
+    feature_collection = FeatureCollection.from_csv(
+        csv_text, Geometry.to_point(["lat", "lon"])
+    )
+    assert [f["geometry"]["coordinates"] for f in feature_collection.features()] == [
+        [0.5, 102.0],
+        [1.5, 103.0],
+    ]
+    assert not csv_text.closed
+    assert (
+        FeatureCollection.from_csv(
+            io.StringIO(""), Geometry.to_point(["lat", "lon"])
+        ).features()
+        == []
+    )
+
+
+def test_feature_collection_from_csv_ragged_rows(tmp_path):
+    """Test that short and long CSV rows keep the csv.DictReader layout."""
+    csv_file = tmp_path / "ragged.csv"
+    csv_file.write_text("id,name,lat,lon\n1,a,0.5,1.0\n2,b\n3,c,1.5,2.0,extra\n")
+
+    def geometry_fn(item: dict[str, Any]) -> Geometry:
+        return Geometry({"type": "Point", "coordinates": [item["lat"], item["lon"]]})
+
+    feature_collection = FeatureCollection.from_csv(str(csv_file), geometry_fn)
+    properties = [f["properties"] for f in feature_collection.features()]
+    assert properties[1] == {"id": "2", "name": "b", "lat": None, "lon": None}
+    assert properties[2][None] == ["extra"]
+    # missing values pass equality filters instead of raising a KeyError
+    filtered = feature_collection.filter(Filter.eq("lat", "0.5")).get_info()
+    assert [f["properties"]["id"] for f in filtered["features"]] == ["1", "2"]
+
+
+def test_feature_collection_ndjson_round_trip(tmp_path):
+    """Test the to_ndjson and from_ndjson methods of FeatureCollection class."""
+    feature_collection_dict: dict[str, Any] = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [102.0, 0.5]},
+                "properties": {"prop0": "value0"},
+            },
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [103.0, 1.5]},
+                "properties": {"prop1": 1},
+            },
+        ],
+    }
+    ndjson_file = tmp_path / "features.geojsonl"
+    FeatureCollection(feature_collection_dict).to_ndjson(ndjson_file)
+    with open(ndjson_file) as f:
+        assert len(f.readlines()) == 2
+
+    feature_collection = FeatureCollection.from_ndjson(ndjson_file)
+    assert feature_collection.to_dict() == feature_collection_dict
+
+    # GeoJSON text sequences prefix each record with a record separator
+    with open(ndjson_file, "w") as f:
+        f.write('\x1e{"geometry": {"type": "Point", "coordinates": [1.0, 2.0]},')
+        f.write(' "properties": {"id": "a"}}\n\n')
+        f.write('{"geometry": {"type": "Point", "coordinates": [3.0, 4.0]},')
+        f.write(' "properties": {"id": "b"}}\n')
+    features = list(FeatureCollection.from_ndjson_stream(ndjson_file))
+    assert len(features) == 2
+    assert features[0]["properties"] == {"id": "a"}
+    # property keys repeated across lines share one string object
+    first_key, second_key = (next(iter(f["properties"])) for f in features)
+    assert first_key is second_key
+
+
+def test_feature_collection_from_ndjson_non_string_type(tmp_path):
+    """Test that a non-string "type" member is read as-is, not interned."""
+    ndjson_file = tmp_path / "features.geojsonl"
+    ndjson_file.write_text(
+        '{"type": null, "geometry": {"type": 1, "coordinates": [1.0, 2.0]}, '
+        '"properties": {}}\n'
+    )
+    (feature,) = FeatureCollection.from_ndjson(ndjson_file).features()
+    assert feature["type"] is None
+    assert feature["geometry"]["type"] == 1
+
+
+def test_feature_collection_from_ndjson_invalid_lines(tmp_path):
+    """Test that lines which are not GeoJSON Features raise a ValueError."""
+    ndjson_file = tmp_path / "features.geojsonl"
+    feature_line = '{"geometry": {"type": "Point", "coordinates": [1.0, 2.0]}, '
+    feature_line += '"properties": {}}\n'
+    for invalid_line in ["[1, 2]", "3", "null", '{"properties": {}}']:
+        ndjson_file.write_text(feature_line + "\n" + invalid_line + "\n")
+        with pytest.raises(ValueError, match="Line 3 of"):
+            FeatureCollection.from_ndjson(ndjson_file)
+
+
+def test_feature_collection_coordinates():
+    """Test the coordinates method of FeatureCollection class."""
+    feature_collection = FeatureCollection(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [0.5, 102.0]},
+                    "properties": {},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [1.5, 103.0]},
+                    "properties": {},
+                },
+            ],
+        }
+    )
+    coordinates = feature_collection.coordinates()
+    assert coordinates.shape == (2, 2)
+    assert coordinates.tolist() == [[0.5, 102.0], [1.5, 103.0]]
+    # the array follows changes to the feature list
+    feature_collection.features().pop()
+    assert feature_collection.coordinates().tolist() == [[0.5, 102.0]]
+    assert FeatureCollection([]).coordinates().shape == (0, 2)
+
+    # a third (altitude) value is ignored rather than shifting later rows
+    with_altitude = FeatureCollection(
+        [
+            Feature(
+                {
+                    "geometry": {"type": "Point", "coordinates": [1.0, 2.0, 3.0]},
+                    "properties": {},
+                }
+            ),
+            Feature(
+                {
+                    "geometry": {"type": "Point", "coordinates": [4.0, 5.0]},
+                    "properties": {},
+                }
+            ),
+        ]
+    )
+    assert with_altitude.coordinates().tolist() == [[1.0, 2.0], [4.0, 5.0]]
+
+    short = FeatureCollection(
+        [
+            Feature(
+                {"geometry": {"type": "Point", "coordinates": [1.0]}, "properties": {}}
+            )
+        ]
+    )
+    with pytest.raises(ValueError, match="at least 2"):
+        short.coordinates()
+
+    line = FeatureCollection(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+                    "properties": {},
+                }
+            ],
+        }
+    )
+    with pytest.raises(ValueError):
+        line.coordinates()
@@ -35,7 +35,7 @@ def test_filter_within_distance():
     del out_dict["_fn"]  # Remove the function for comparison
     assert out_dict["_join_fn"] is not None
     del out_dict["_join_fn"]  # Remove the function for comparison
-    assert filter.to_dict() == {
+    assert out_dict == {
         "_type": "within_distance",
         "_left_field": "geo1",
         "_right_field": "geo2",
@@ -79,7 +79,7 @@ def test_filter_date():
     out_dict = filter.to_dict()
     assert out_dict["_fn"] is not None
     del out_dict["_fn"]  # Remove the function for comparison
-    assert filter.to_dict() == {
+    assert out_dict == {
         "_type": "date",
         "_field": "date_field",
         "_start": "2023-01-01",
@@ -109,6 +109,7 @@ def test_filter_apply_feature_collection():
         "_quality_key": "match_quality",
         "_join_fn": None,
     }
+    assert filter.to_dict()["_fn"] is not None
     applied_filter = filter.apply_feature_collection(fc)
     assert applied_filter is not None
     out_dict = applied_filter.to_dict()
@@ -124,3 +125,158 @@ def test_filter_apply_feature_collection():
         "_quality_key": "match_quality",
         "_join_fn": None,
     }
+
+
+def test_filter_within_distance_compute():
+    """Test computing a within_distance filter joined to a FeatureCollection."""
+    filter = da.Filter.within_distance(
+        left_field=".geo", right_field=".geo", distance=5000
+    )
+    # about 11.1 km north, 1.1 km north, 11.1 km east, 3.3 km east and 4.4 km north
+    coordinates = [[0.1, 0.0], [0.01, 0.0], [0.0, 0.1], [0.0, 0.03], [0.04, 0.0]]
+    right = da.FeatureCollection(
+        [
+            da.Feature(
+                {
+                    "properties": {"id": f"r{i}"},
+                    "geometry": {"type": "Point", "coordinates": coords},
+                }
+            )
+            for i, coords in enumerate(coordinates)
+        ]
+    )
+    left = da.Feature(
+        {
+            "properties": {"id": "l0"},
+            "geometry": {"type": "Point", "coordinates": [0, 0]},
+        }
+    )
+    joined = filter.apply_feature_collection(right)
+    matches = joined.compute([left])
+    assert [match["properties"]["id"] for match in matches] == ["r1", "r3", "r4"]
+    matches = joined.compute([left, left])
+    assert len(matches) == 6
+
+    empty = filter.apply_feature_collection(da.FeatureCollection([]))
+    assert empty.compute([left]) == []
+
+    # the same filter joined to another collection does not reuse the old index
+    other = filter.apply_feature_collection(da.FeatureCollection(right.features()[:2]))
+    assert [match["properties"]["id"] for match in other.compute([left])] == ["r1"]
+    assert [match["properties"]["id"] for match in joined.compute([left])] == [
+        "r1",
+        "r3",
+        "r4",
+    ]
+
+
+def test_filter_within_distance_mutated_collection():
+    """Test that changes to the joined features between computes are seen."""
+
+    def point(id, lat):
+        return da.Feature(
+            {
+                "properties": {"id": id},
+                "geometry": {"type": "Point", "coordinates": [lat, 0.0]},
+            }
+        )
+
+    right = da.FeatureCollection([point("r0", 0.01), point("r1", 1.0)])
+    left = point("l0", 0.0)
+    joined = da.Filter.within_distance(".geo", ".geo", 5000).apply_feature_collection(
+        right
+    )
+    assert [match["properties"]["id"] for match in joined.compute([left])] == ["r0"]
+
+    right.features().append(point("r2", 0.02))
+    assert [match["properties"]["id"] for match in joined.compute([left])] == [
+        "r0",
+        "r2",
+    ]
+
+    right.features().pop(0)
+    right.features().pop()
+    assert joined.compute([left]) == []
+
+
+def test_filter_join_fn_receives_feature_list():
+    """Test that a custom join function receives the joined features as a list."""
+    right = da.FeatureCollection(
+        [
+            da.Feature(
+                {
+                    "properties": {"id": "r0"},
+                    "geometry": {"type": "Point", "coordinates": [0.0, 0.0]},
+                }
+            )
+        ]
+    )
+    calls = []
+
+    def join_fn(left, right_features, match_key, quality_key):
+        calls.append((right_features, match_key, quality_key))
+        return right_features
+
+    filter = da.Filter(fn=lambda feature: True, join_fn=join_fn)
+    matches = filter.apply_feature_collection(right).compute(right.features())
+    assert matches == right.features()
+    assert calls == [(right.features(), "match_id", "match_quality")]
+
+
+def test_filter_within_distance_extent():
+    """Test within_distance when the distance covers or misses every point."""
+    right = da.FeatureCollection(
+        [
+            da.Feature(
+                {
+                    "properties": {"id": f"r{i}"},
+                    "geometry": {"type": "Point", "coordinates": coords},
+                }
+            )
+            for i, coords in enumerate([[10.0, 20.0], [10.5, 20.5], [9.5, 19.5]])
+        ]
+    )
+    left = da.Feature(
+        {"properties": {}, "geometry": {"type": "Point", "coordinates": [10.0, 20.0]}}
+    )
+    far = da.Feature(
+        {"properties": {}, "geometry": {"type": "Point", "coordinates": [-40.0, 0.0]}}
+    )
+
+    # every point is well within 500 km
+    joined = da.Filter.within_distance(".geo", ".geo", 500000)
+    matches = joined.apply_feature_collection(right).compute([left, far])
+    assert [match["properties"]["id"] for match in matches] == ["r0", "r1", "r2"]
+
+    # only the point at the left location is within 50 km
+    joined = da.Filter.within_distance(".geo", ".geo", 50000)
+    matches = joined.apply_feature_collection(right).compute([left, far])
+    assert [match["properties"]["id"] for match in matches] == ["r0"]
+
+
+def test_filter_compute_all():
+    """Test applying a sequence of plain and join filters."""
+    geo = da.Geometry({"type": "Point", "coordinates": [0.0, 0.0]})
+    features = [
+        da.Feature(
+            {
+                "properties": {"id": f"f{i}", "status": status, "kind": kind},
+                "geometry": geo,
+            }
+        )
+        for i, (status, kind) in enumerate(
+            [("active", "a"), ("active", "b"), ("inactive", "a"), ("active", "a")]
+        )
+    ]
+    fc = da.FeatureCollection(features)
+    fused = fc.filter([da.Filter.eq("status", "active"), da.Filter.eq("kind", "a")])
+    assert [f["properties"]["id"] for f in fused.compute().features()] == ["f0", "f3"]
+
+    # a join between plain filters still sees only the features that passed before
+    right = da.FeatureCollection(features[:1])
+    join = da.Filter.within_distance(".geo", ".geo", 10).apply_feature_collection(right)
+    filtered = da.Filter.compute_all(
+        [da.Filter.eq("kind", "a"), join, da.Filter.eq("status", "active")], features
+    )
+    assert [f["properties"]["id"] for f in filtered] == ["f0", "f0", "f0"]
+    assert da.Filter.compute_all([], features) == features
@@ -24,6 +24,8 @@
 from collections.abc import Callable
 from typing import Any
 
+import pytest
+
 from data_agents import Geometry
 
 
@@ -42,6 +44,8 @@ def test_geometry_getitem():
     geometry = Geometry(geom_dict)
     assert geometry["type"] == "Point"
     assert geometry["coordinates"] == [102.0, 0.5]
+    with pytest.raises(KeyError):
+        geometry["missing"]
 
 
 def test_geometry_to_point():